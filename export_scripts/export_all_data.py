@@ -1,48 +1,63 @@
+import contextlib
+import importlib
+import io
 import os
-import subprocess
+import multiprocessing
+import sys
+import traceback
 from datetime import datetime
 import argparse
 
+# Make the worker modules importable regardless of the caller's cwd.
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPT_DIR)
+
 WORKERS = ["export_personal_data.py","export_evolutions.py","export_weight.py","export_offspring.py","export_moves.py","export_level_up_learnsets.py","export_egg_learnsets.py","export_tutors.py","export_tutor_learnsets.py","export_encounters.py","export_trainers.py","export_constants.py"]
 OUTPUT_ROOT = "output"
 SUMMARY_FILENAME = "export_summary.txt"
 
 def run_worker(script_name, source, output_folder):
-    script_path = os.path.join(os.path.dirname(__file__), script_name)
-    cmd = ["python", script_path, "--source", source, "--output", output_folder]
-
-    print(f"\n> Running {script_name}...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    print(result.stdout.strip())
-
-    status = "[OK] SUCCESS" if result.returncode == 0 else "[X] FAILED"
-    warnings_file = [f for f in os.listdir(output_folder) if f.startswith("warnings_")]
-
-    if warnings_file:
-        print(f"[!] Warning file(s): {', '.join(warnings_file)}")
-
-    if result.stderr.strip():
-        print(f"STDERR:\n{result.stderr.strip()}")
+    # Import the worker module and call it directly instead of spawning a
+    # fresh interpreter per script, which costs startup + re-import time.
+    module_name = script_name[:-3]
+    stdout_buf = io.StringIO()
+    stderr_buf = io.StringIO()
+
+    try:
+        module = importlib.import_module(module_name)
+        with contextlib.redirect_stdout(stdout_buf), contextlib.redirect_stderr(stderr_buf):
+            returncode = module.run_export(source, output_folder)
+    except Exception:
+        returncode = 1
+        stderr_buf.write(traceback.format_exc())
+
+    status = "[OK] SUCCESS" if returncode == 0 else "[X] FAILED"
 
     return {
         "script": script_name,
         "status": status,
-        "warnings": warnings_file,
-        "stdout": result.stdout.strip(),
-        "stderr": result.stderr.strip(),
+        "stdout": stdout_buf.getvalue().strip(),
+        "stderr": stderr_buf.getvalue().strip(),
     }
 
-def write_summary(results, output_folder, source_path):
+
+def _run_worker_tuple(task):
+    """Unpack a (script_name, source, output_folder) task for pool dispatch."""
+    return run_worker(*task)
+
+def write_summary(results, output_folder, source_path, warning_files):
     summary_path = os.path.join(output_folder, SUMMARY_FILENAME)
     with open(summary_path, "w", encoding="utf-8") as f:
         f.write("=== Export Summary ===\n")
         f.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Source folder: {source_path}\n\n")
+        f.write(f"Source folder: {source_path}\n")
+        if warning_files:
+            f.write(f"Warning file(s): {', '.join(warning_files)}\n")
+        f.write("\n")
 
         for r in results:
             f.write(f"{r['script']}: {r['status']}\n")
-            if r["warnings"]:
-                f.write(f"  Warnings: {', '.join(r['warnings'])}\n")
             if r["stderr"]:
                 f.write(f"  STDERR:\n    {r['stderr'].replace(os.linesep, os.linesep + '    ')}\n")
         f.write("\nAll exports complete.\n")
@@ -62,12 +77,32 @@ def main():
     print(f"Source folder: {args.source}")
     print(f"Output folder: {output_folder}\n")
 
+    tasks = [(worker, args.source, output_folder) for worker in WORKERS]
     results = []
 
-    for worker in WORKERS:
-        results.append(run_worker(worker, args.source, output_folder))
-
-    write_summary(results, output_folder, args.source)
+    # Workers read disjoint source files and write disjoint CSVs, so they can
+    # run in parallel. imap_unordered reports each worker as soon as it finishes.
+    with multiprocessing.Pool(processes=min(len(WORKERS), (os.cpu_count() or 4))) as pool:
+        for result in pool.imap_unordered(_run_worker_tuple, tasks):
+            results.append(result)
+
+            # One write per worker so its block can't interleave with others.
+            block = f"\n> Finished {result['script']}\n{result['stdout']}"
+            if result["stderr"]:
+                block += f"\nSTDERR:\n{result['stderr']}"
+            print(block)
+
+    # Keep the summary in WORKERS order regardless of completion order.
+    results.sort(key=lambda r: WORKERS.index(r["script"]))
+
+    # One scan of the finished output folder instead of a listdir per worker
+    # (which also raced against workers still writing their files).
+    with os.scandir(output_folder) as it:
+        warning_files = sorted(e.name for e in it if e.name.startswith("warnings_"))
+    if warning_files:
+        print(f"[!] Warning file(s): {', '.join(warning_files)}")
+
+    write_summary(results, output_folder, args.source, warning_files)
 
     print("\n=== Export Summary ===")
     for r in results:
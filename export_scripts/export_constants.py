@@ -2,7 +2,9 @@ import os
 import csv
 import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 
 # ======================================
@@ -52,6 +54,8 @@ SPECS = [
 ]
 
 TRAINER_NAME_RE = re.compile(r"^\{TRAINER_NAME:\s*(.*?)\}$")
+MULTI_SPACE_RE = re.compile(r"\s{2,}")
+TRAILING_BREAKS_RE = re.compile(r"(?:\\n)+$")
 
 
 # ======================================
@@ -62,20 +66,16 @@ def _read_lines_textarchive(path: Path, warnings: list[str]) -> tuple[list[str],
     Returns (lines, encoding_used).
 
     These archives are typically UTF-8. Decoding UTF-8 bytes as cp1252 produces
-    mojibake like 'â€™' and 'Ã©'. Strategy:
-      1) utf-8-sig strict
-      2) utf-8 strict
-      3) utf-8 with replacement (log a warning)
+    mojibake like 'â€™' and 'Ã©'. utf-8-sig strict covers both BOM and plain
+    UTF-8 files in a single decode attempt; only genuinely broken bytes fall
+    back to replacement (logged as a warning).
     """
     data = path.read_bytes()
-    for enc in ("utf-8-sig", "utf-8"):
-        try:
-            return data.decode(enc).splitlines(), enc
-        except UnicodeDecodeError:
-            continue
-
-    warnings.append(f"[WARN] {path.name}: utf-8 strict decode failed; used utf-8 with replacement.")
-    return data.decode("utf-8", errors="replace").splitlines(), "utf-8-replace"
+    try:
+        return data.decode("utf-8-sig").splitlines(), "utf-8-sig"
+    except UnicodeDecodeError:
+        warnings.append(f"[WARN] {path.name}: utf-8 strict decode failed; used utf-8 with replacement.")
+        return data.decode("utf-8", errors="replace").splitlines(), "utf-8-replace"
 def _transform(kind: str, s: str, warnings: list[str], context: str) -> str:
     if kind == "default":
         return s
@@ -105,13 +105,12 @@ def _transform(kind: str, s: str, warnings: list[str], context: str) -> str:
         else:
             warnings.append(f"[WARN] {context}: expected 4 literal \\n sequences, found {count}.")
 
-        # Strip trailing literal "\n" sequences
-        while s.endswith(r"\n"):
-            s = s[:-2]
+        # Strip trailing literal "\n" sequences in one pass
+        s = TRAILING_BREAKS_RE.sub("", s)
 
         # Replace remaining internal literal "\n" with spaces
         s = s.replace(r"\n", " ")
-        s = re.sub(r"\s{2,}", " ", s).strip()
+        s = MULTI_SPACE_RE.sub(" ", s).strip()
         return s
 
     if kind == "desc2":
@@ -123,13 +122,12 @@ def _transform(kind: str, s: str, warnings: list[str], context: str) -> str:
         if count >= 3:
             warnings.append(f"[WARN] {context}: unexpected literal \\n count {count}.")
 
-        # Strip trailing literal "\n" sequences
-        while s.endswith(r"\n"):
-            s = s[:-2]
+        # Strip trailing literal "\n" sequences in one pass
+        s = TRAILING_BREAKS_RE.sub("", s)
 
         # Replace remaining internal literal "\n" with spaces
         s = s.replace(r"\n", " ")
-        s = re.sub(r"\s{2,}", " ", s).strip()
+        s = MULTI_SPACE_RE.sub(" ", s).strip()
         return s
 
 
@@ -137,32 +135,61 @@ def _transform(kind: str, s: str, warnings: list[str], context: str) -> str:
     return s
 
 
-def _write_csv(path: Path, id_col: str, text_col: str, rows: list[tuple[int, str]]) -> None:
+def _write_csv(path: Path, id_col: str, text_col: str, rows) -> None:
+    """Write header + rows; rows may be any iterable of (id, text) pairs."""
     with path.open("w", newline="", encoding="utf-8") as f:
         w = csv.writer(f)
         w.writerow([id_col, text_col])
-        for i, txt in rows:
-            w.writerow([i, txt])
+        w.writerows(rows)
+
+
+def _export_one_spec(source_root: Path, output_dir: Path,
+                     spec: tuple[str, str, str, str, str]) -> tuple[Path | None, list[str]]:
+    """
+    Export a single SPECS entry. Returns (output path or None on failure,
+    warnings produced for this spec).
+    """
+    src_rel, out_name, id_col, text_col, transform_kind = spec
+    src_path = source_root / src_rel
+    out_path = output_dir / out_name
+    spec_warnings: list[str] = []
+
+    try:
+        lines, enc_used = _read_lines_textarchive(src_path, spec_warnings)
+    except UnicodeDecodeError:
+        spec_warnings.append(f"[ERROR] Could not decode source file: {src_path}")
+        return None, spec_warnings
+
+    if len(lines) < 2:
+        spec_warnings.append(f"[ERROR] {src_path}: expected at least 2 lines (file header + one record).")
+        return None, spec_warnings
+
+    # Stream transformed records straight into the CSV writer instead of
+    # materialising the full row list first. islice skips the first row
+    # (file number) without copying the line list. raw_line is +1 for
+    # 0-index, +1 for the skipped header.
+    rows = (
+        (idx, _transform(transform_kind, raw, spec_warnings,
+                         f"{src_path.name}:record_index={idx},raw_line={idx + 2}"))
+        for idx, raw in enumerate(islice(lines, 1, None))
+    )
+    _write_csv(out_path, id_col, text_col, rows)
+    return out_path, spec_warnings
 
 
 # ======================================
 # Entry Point
 # ======================================
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Export textArchive constants into CSV lookup tables.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>/)")
-    args = parser.parse_args()
-
+def run_export(source: str, output: str | None = None) -> int:
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_root = Path(args.source)
+    source_root = Path(source)
     if not source_root.exists():
         print(f"[ERROR] Source folder not found: {source_root}")
         return 1
@@ -170,11 +197,20 @@ def main() -> int:
     warnings: list[str] = []
     outputs_written: list[Path] = []
 
-    # Fail fast if any source files are missing
+    # Fail fast if any source files are missing. All archives live in the
+    # same folder, so one scandir replaces a stat() call per source file;
+    # grouping by parent keeps this correct if layouts ever diverge.
     missing = []
+    dir_entries: dict[Path, set[str]] = {}
     for src_rel, _, _, _, _ in SPECS:
         p = source_root / src_rel
-        if not p.exists():
+        if p.parent not in dir_entries:
+            try:
+                with os.scandir(p.parent) as it:
+                    dir_entries[p.parent] = {entry.name for entry in it}
+            except FileNotFoundError:
+                dir_entries[p.parent] = set()
+        if p.name not in dir_entries[p.parent]:
             missing.append(str(p))
     if missing:
         for m in missing:
@@ -184,30 +220,16 @@ def main() -> int:
         print(f"[ERROR] Missing {len(missing)} required textArchive file(s). See log: {log_path}")
         return 1
 
-    # Export each file
-    for src_rel, out_name, id_col, text_col, transform_kind in SPECS:
-        src_path = source_root / src_rel
-        out_path = output_dir / out_name
-
-        try:
-            lines, enc_used = _read_lines_textarchive(src_path, warnings)
-        except UnicodeDecodeError:
-            warnings.append(f"[ERROR] Could not decode source file: {src_path}")
-            continue
-
-        if len(lines) < 2:
-            warnings.append(f"[ERROR] {src_path}: expected at least 2 lines (file header + one record).")
-            continue
-
-        records = lines[1:]  # ignore first row (file number)
-        rows: list[tuple[int, str]] = []
-        for idx, raw in enumerate(records):
-            raw_line_number = idx + 2  # +1 for 0-index, +1 for skipped header
-            ctx = f"{src_path.name}:record_index={idx},raw_line={raw_line_number}"
-            rows.append((idx, _transform(transform_kind, raw, warnings, ctx)))
-
-        _write_csv(out_path, id_col, text_col, rows)
-        outputs_written.append(out_path)
+    # Export the archives concurrently; each spec reads and writes its own
+    # files, so threads only contend on I/O. pool.map preserves SPECS order,
+    # and per-spec warning lists are merged in that order, keeping the log
+    # deterministic.
+    with ThreadPoolExecutor(max_workers=len(SPECS)) as pool:
+        for out_path, spec_warnings in pool.map(
+                lambda spec: _export_one_spec(source_root, output_dir, spec), SPECS):
+            warnings.extend(spec_warnings)
+            if out_path is not None:
+                outputs_written.append(out_path)
 
     # Only create log if warnings/errors exist
     if warnings:
@@ -237,5 +259,13 @@ def main() -> int:
     return 1
 
 
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export textArchive constants into CSV lookup tables.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>/)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
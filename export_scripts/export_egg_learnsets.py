@@ -1,7 +1,11 @@
 import os
 import csv
 import argparse
+import mmap
+import sys
+from array import array
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
 
 
@@ -17,35 +21,20 @@ START_OFFSET = 0x3C  # skip NARC header data
 MAX_MOVES = 16       # max egg moves per species
 
 
-# ======================================
-# Helper Function
-# ======================================
-
-def read_u16_le(f):
-    """Read a 2-byte little-endian unsigned integer."""
-    b = f.read(2)
-    return int.from_bytes(b, "little") if b else None
-
-
 # ======================================
 # Main Function
 # ======================================
 
-def main():
-    parser = argparse.ArgumentParser(description="Export egg learnsets from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -56,18 +45,38 @@ def main():
     warnings = []
     learnsets = []
 
+    # Memory-map the source so the u16 scan reads straight from the page
+    # cache instead of issuing a 2-byte read() syscall per value.
     with open(source_path, "rb") as f:
-        f.seek(START_OFFSET)
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            buf = b""
+
+        # Locate the u16-aligned FF FF terminator with a C-level search and
+        # cut the payload there, so the value loop never has to compare
+        # against the terminator itself.
+        payload = buf[START_OFFSET:]
+        idx = payload.find(b"\xff\xff")
+        while idx != -1 and idx % 2:
+            idx = payload.find(b"\xff\xff", idx + 1)
+        if idx != -1:
+            payload = payload[:idx]
+
+        # Convert the whole payload to u16 values in one C-level pass rather
+        # than decoding two bytes at a time in Python.
+        values = array("H")
+        values.frombytes(payload[:len(payload) & ~1])
+        if sys.byteorder == "big":
+            values.byteswap()
+        if len(payload) % 2:
+            # A lone trailing byte is still treated as a value, as before.
+            values = chain(values, (payload[-1],))
+
         current_species = None
         current_moves = []
 
-        while True:
-            num = read_u16_le(f)
-            if num is None:
-                break
-            if num == 0xFFFF:
-                break
-
+        for num in values:
             if num >= 20000:
                 # Save previous species if one was active
                 if current_species is not None:
@@ -97,6 +106,9 @@ def main():
             row += [""] * (MAX_MOVES - len(row) + 1)
             learnsets.append(row)
 
+        if isinstance(buf, mmap.mmap):
+            buf.close()
+
     # Write CSV
     headers = ["species_id"] + [f"egg_move_{i:02d}" for i in range(1, MAX_MOVES + 1)]
     with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
@@ -114,5 +126,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export egg learnsets from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()
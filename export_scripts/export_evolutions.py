@@ -1,6 +1,7 @@
 import os
 import csv
 import argparse
+import struct
 from datetime import datetime
 from pathlib import Path
 
@@ -19,31 +20,24 @@ SKIP_FIRST = True  # skip species_id 0
 # ======================================
 # Main Function
 # ======================================
-def parse_evolution_entry(data):
-    """Parse a 6-byte evolution entry (method, parameter, target species)."""
-    method = int.from_bytes(data[0:2], "little")
-    param = int.from_bytes(data[2:4], "little")
-    target = int.from_bytes(data[4:6], "little")
-    return method, param, target
+# 6-byte evolution entry: method, parameter, target species (all u16le).
+# iter_unpack decodes a whole species' slot block in one C-level pass
+# instead of one int.from_bytes call per field.
+EVO_STRUCT = struct.Struct("<3H")
 
 # ======================================
 # Entry Point
 # ======================================
-def main():
-    parser = argparse.ArgumentParser(description="Export evolution data from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -64,10 +58,8 @@ def main():
         warnings.append(f"[WARN] Data length mismatch: expected {expected_length} bytes, got {actual_length}")
 
     with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=[
-            "species_id", "evolution_method", "evolution_parameter", "target_species_id"
-        ])
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(["species_id", "evolution_method", "evolution_parameter", "target_species_id"])
 
         for species_id in range(TOTAL_EXPECTED_SPECIES):
             if SKIP_FIRST and species_id == 0:
@@ -75,17 +67,12 @@ def main():
 
             offset = species_id * bytes_per_species
             species_data = data[offset:offset + bytes_per_species - 2]  # skip padding
+            species_data = species_data[:len(species_data) - len(species_data) % 6]
 
-            for i in range(0, len(species_data), 6):
-                method, param, target = parse_evolution_entry(species_data[i:i+6])
+            for method, param, target in EVO_STRUCT.iter_unpack(species_data):
                 if method == 0 and param == 0 and target == 0:
                     continue
-                writer.writerow({
-                    "species_id": species_id,
-                    "evolution_method": method,
-                    "evolution_parameter": param,
-                    "target_species_id": target
-                })
+                writer.writerow([species_id, method, param, target])
 
     # Only create log if warnings exist
     if warnings:
@@ -97,5 +84,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export evolution data from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     exit(main())
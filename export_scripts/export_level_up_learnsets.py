@@ -1,6 +1,8 @@
 import os
 import csv
 import argparse
+import sys
+from array import array
 from datetime import datetime
 from pathlib import Path
 
@@ -20,35 +22,35 @@ SKIP_FIRST = True  # skip species_id 0
 # Helper Functions
 # ======================================
 
-def decode_entry(b0, b1):
-    """Decode a 2-byte level-up entry."""
-    level = b1 // 2
-    move_id = b0 + (256 if b1 & 1 else 0)
-    return move_id, level
-
-
 def parse_species_learnset(data, offset, logs):
     """Parse one species learnset block."""
-    rows = []
-    i = offset
     n = len(data)
 
-    while i + 1 < n:
-        b0, b1 = data[i], data[i + 1]
-
-        # Detect terminator patterns (FF FF or FF FF 00 00)
-        if b0 == 0xFF and b1 == 0xFF:
-            # If followed by optional 00 00, consume those too
-            if i + 3 < n and data[i + 2] == 0x00 and data[i + 3] == 0x00:
-                i += 4
-            else:
-                i += 2
-            break
+    # Locate the entry-aligned FF FF terminator with C-level find() instead
+    # of stepping through byte pairs in Python. find() may land on an FF FF
+    # straddling two entries; keep searching until the hit lines up.
+    end = data.find(b"\xff\xff", offset)
+    while end != -1 and (end - offset) % 2:
+        end = data.find(b"\xff\xff", end + 1)
+
+    if end == -1:
+        # No terminator: decode every complete pair and stop there.
+        end = offset + ((n - offset) // 2) * 2
+        i = end
+    elif end + 3 < n and data[end + 2] == 0x00 and data[end + 3] == 0x00:
+        # Terminator followed by optional 00 00: consume those too
+        i = end + 4
+    else:
+        i = end + 2
 
-        move_id, level = decode_entry(b0, b1)
-        rows.append((move_id, level))
-        i += 2
+    # Bulk-decode the span as little-endian u16 values: low 9 bits are the
+    # move_id, the high 7 bits the level.
+    values = array("H")
+    values.frombytes(data[offset:end])
+    if sys.byteorder == "big":
+        values.byteswap()
 
+    rows = [(v & 0x1FF, v >> 9) for v in values]
     return rows, i
 
 
@@ -56,21 +58,16 @@ def parse_species_learnset(data, offset, logs):
 # Main Function
 # ======================================
 
-def main():
-    parser = argparse.ArgumentParser(description="Export level-up learnsets from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -117,5 +114,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export level-up learnsets from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()
@@ -1,6 +1,7 @@
 import os
 import csv
 import argparse
+import struct
 from datetime import datetime
 from pathlib import Path
 
@@ -17,58 +18,51 @@ SKIP_FIRST = True  # skip move_id 0
 # ======================================
 # Main Function
 # ======================================
-def parse_move_entry(data, move_id):
-    move_effect = int.from_bytes(data[0:2], "little")
-    category = data[2]
-    power = data[3]
-    move_type = data[4]
-    accuracy = data[5]
-    pp = data[6]
-    side_effect_rate = data[7]
-    range_flags = int.from_bytes(data[8:10], "little")
-    priority = data[10] if data[10] <= 10 else data[10] - 256
-    flags = data[11]
-    contest_appeal = data[12]
-    contest_condition = data[13]
-    padding = data[14:16]
+MOVE_FIELDNAMES = [
+    "move_id", "move_effect_script_id", "category", "power", "type",
+    "accuracy", "power_points", "side_effect_rate", "range", "priority",
+    "contest_appeal", "contest_condition"
+]
+
+
+# 16-byte move record: effect script u16, six u8 fields, range flags u16,
+# raw priority byte, flags/contest u8s, then 2 padding bytes.
+MOVE_STRUCT = struct.Struct("<H6BHB3B2s")
+
+
+def parse_move_entry(data, offset, move_id):
+    (move_effect, category, power, move_type, accuracy, pp, side_effect_rate,
+     range_flags, raw_priority, flags, contest_appeal, contest_condition,
+     padding) = MOVE_STRUCT.unpack_from(data, offset)
+
+    # Priority is read unsigned and sign-fixed by hand (not struct 'b') to
+    # keep the existing treatment of out-of-range positive values.
+    priority = raw_priority if raw_priority <= 10 else raw_priority - 256
 
     warning = None
     if padding != b"\x00\x00":
         warning = f"[WARN] Padding not 00 00 for move_id {move_id}"
 
-    return {
-        "move_id": move_id,
-        "move_effect_script_id": move_effect,
-        "category": category,
-        "power": power,
-        "type": move_type,
-        "accuracy": accuracy,
-        "power_points": pp,
-        "side_effect_rate": side_effect_rate,
-        "range": range_flags,
-        "priority": priority,
-        "contest_appeal": contest_appeal,
-        "contest_condition": contest_condition,
-    }, warning
+    # Positional row matching MOVE_FIELDNAMES
+    return (
+        move_id, move_effect, category, power, move_type,
+        accuracy, pp, side_effect_rate, range_flags, priority,
+        contest_appeal, contest_condition,
+    ), warning
 
 # ======================================
 # Entry Point
 # ======================================
-def main():
-    parser = argparse.ArgumentParser(description="Export move data from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -82,19 +76,14 @@ def main():
     warnings = []
 
     with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=[
-            "move_id", "move_effect_script_id", "category", "power", "type",
-            "accuracy", "power_points", "side_effect_rate", "range", "priority",
-            "contest_appeal", "contest_condition"
-        ])
-        writer.writeheader()
+        writer = csv.writer(csvfile)
+        writer.writerow(MOVE_FIELDNAMES)
 
         move_size = 16
         for move_id in range(0, len(data) // move_size):
             if SKIP_FIRST and move_id == 0:
                 continue
-            entry_data = data[move_id * move_size:(move_id + 1) * move_size]
-            parsed, warning = parse_move_entry(entry_data, move_id)
+            parsed, warning = parse_move_entry(data, move_id * move_size, move_id)
             writer.writerow(parsed)
             if warning:
                 warnings.append(warning)
@@ -109,5 +98,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export move data from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     exit(main())
@@ -1,6 +1,7 @@
 import os
-import csv
 import argparse
+import sys
+from array import array
 from datetime import datetime
 from pathlib import Path
 
@@ -20,21 +21,16 @@ SKIP_FIRST = True  # skip species_id 0
 # Main Function
 # ======================================
 
-def main():
-    parser = argparse.ArgumentParser(description="Export offspring species data from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -53,17 +49,25 @@ def main():
     total_species = len(data) // 2
     expected_bytes = total_species * 2
 
-    # Create the CSV
+    # Decode the whole file as little-endian u16 values in one pass instead
+    # of one int.from_bytes call per species.
+    offspring_ids = array("H")
+    offspring_ids.frombytes(data[:total_species * 2])
+    if sys.byteorder == "big":
+        offspring_ids.byteswap()
+
+    start_id = 1 if SKIP_FIRST else 0
+
+    # Create the CSV. Rows are two plain integers, so the csv dialect
+    # machinery buys nothing: format the whole file with str.join and write
+    # it in one call (keeping csv.writer's \r\n line endings).
+    lines = [f"{species_id},{offspring_id}"
+             for species_id, offspring_id
+             in zip(range(start_id, total_species), offspring_ids[start_id:])]
     with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["species_id", "offspring_species_id"])
-
-        for i in range(total_species):
-            start = i * 2
-            offspring_id = int.from_bytes(data[start:start + 2], "little")
-
-            if not (SKIP_FIRST and i == 0):
-                writer.writerow([i, offspring_id])
+        csvfile.write("species_id,offspring_species_id\r\n")
+        if lines:
+            csvfile.write("\r\n".join(lines) + "\r\n")
 
     # Warn if extra data remain (possible in modified ROMs)
     if len(data) > expected_bytes:
@@ -80,5 +84,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export offspring species data from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,9 @@
 import os
 import csv
 import argparse
+import struct
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -23,75 +25,91 @@ BYTES_PER_SPECIES = 44  # bytes per species entry
 # Helper Functions
 # ======================================
 
-def parse_ev_yield(data):
-    """Decode the 2-byte EV yield value into its 6 component stats."""
-    ev_yield = int.from_bytes(data, "little")
-    return {
-        "ev_yield_hp": ((ev_yield >> 8) & 1) + ((ev_yield >> 9) & 1) * 2,
-        "ev_yield_atk": ((ev_yield >> 10) & 1) + ((ev_yield >> 11) & 1) * 2,
-        "ev_yield_def": ((ev_yield >> 12) & 1) + ((ev_yield >> 13) & 1) * 2,
-        "ev_yield_spd": ((ev_yield >> 14) & 1) + ((ev_yield >> 15) & 1) * 2,
-        "ev_yield_spatk": (ev_yield & 1) + ((ev_yield >> 1) & 1) * 2,
-        "ev_yield_spdef": ((ev_yield >> 2) & 1) + ((ev_yield >> 3) & 1) * 2,
-    }
-
-
-def parse_personal_entry(data, species_id):
-    """Parse the first 44 bytes of a species record into structured fields."""
-    fields = {
-        "species_id": species_id,
-        "base_stat_hp": data[0],
-        "base_stat_atk": data[1],
-        "base_stat_def": data[2],
-        "base_stat_spd": data[3],
-        "base_stat_spatk": data[4],
-        "base_stat_spdef": data[5],
-        "type_1": data[6],
-        "type_2": data[7],
-        "catch_rate": data[8],
-        "base_exp_yield": data[9],
-        "held_item_1": int.from_bytes(data[12:14], "little"),
-        "held_item_2": int.from_bytes(data[14:16], "little"),
-        "gender_ratio": data[16],
-        "hatch_steps_rate": data[17],
-        "base_friendship": data[18],
-        "growth_rate": data[19],
-        "egg_group_1": data[20],
-        "egg_group_2": data[21],
-        "ability_1": data[22],
-        "ability_2": data[23],
-        "flee_rate": data[24],
-        "colour": data[25],
-    }
-    fields.update(parse_ev_yield(data[10:12]))
-    return fields
+@lru_cache(maxsize=None)
+def parse_ev_yield(ev_yield):
+    """Decode an EV yield u16 into its 6 component stats (hp, atk, def,
+    spd, spatk, spdef — matching the output column order).
+
+    Cached by value: only a handful of distinct yield patterns exist across
+    the dex, so most species reuse an already-decoded result.
+    """
+    return (
+        ((ev_yield >> 8) & 1) + ((ev_yield >> 9) & 1) * 2,    # hp
+        ((ev_yield >> 10) & 1) + ((ev_yield >> 11) & 1) * 2,  # atk
+        ((ev_yield >> 12) & 1) + ((ev_yield >> 13) & 1) * 2,  # def
+        ((ev_yield >> 14) & 1) + ((ev_yield >> 15) & 1) * 2,  # spd
+        (ev_yield & 1) + ((ev_yield >> 1) & 1) * 2,           # spatk
+        ((ev_yield >> 2) & 1) + ((ev_yield >> 3) & 1) * 2,    # spdef
+    )
+
+
+# First 26 bytes of a species record: 10 u8 stats/types/rates, then the EV
+# yield and two held items as u16le, then 10 more u8 fields. The remaining
+# bytes (padding + machine learnset) are handled separately.
+PERSONAL_STRUCT = struct.Struct("<10B3H10B")
+
+PERSONAL_FIELDNAMES = [
+    "species_id", "base_stat_hp", "base_stat_atk", "base_stat_def",
+    "base_stat_spd", "base_stat_spatk", "base_stat_spdef",
+    "type_1", "type_2", "catch_rate", "base_exp_yield",
+    "ev_yield_hp", "ev_yield_atk", "ev_yield_def", "ev_yield_spd",
+    "ev_yield_spatk", "ev_yield_spdef",
+    "held_item_1", "held_item_2",
+    "gender_ratio", "hatch_steps_rate", "base_friendship",
+    "growth_rate", "egg_group_1", "egg_group_2",
+    "ability_1", "ability_2", "flee_rate", "colour"
+]
+
+MACHINE_FIELDNAMES = ["species_id"] + [f"machine_{i:03d}" for i in range(1, 101)]
+
+
+def parse_personal_entry(data, offset, species_id):
+    """Parse a 44-byte species record at the given offset into a positional
+    row matching PERSONAL_FIELDNAMES."""
+    (hp, atk, dfn, spd, spatk, spdef, type_1, type_2, catch_rate, base_exp,
+     ev_yield, held_item_1, held_item_2,
+     gender_ratio, hatch_steps_rate, base_friendship, growth_rate,
+     egg_group_1, egg_group_2, ability_1, ability_2, flee_rate,
+     colour) = PERSONAL_STRUCT.unpack_from(data, offset)
+
+    return (
+        species_id, hp, atk, dfn, spd, spatk, spdef,
+        type_1, type_2, catch_rate, base_exp,
+        *parse_ev_yield(ev_yield),
+        held_item_1, held_item_2,
+        gender_ratio, hatch_steps_rate, base_friendship,
+        growth_rate, egg_group_1, egg_group_2,
+        ability_1, ability_2, flee_rate, colour,
+    )
+
+
+# LSB-first bits of every byte value, so learnset expansion is a table
+# lookup per byte instead of 100 shift/mask operations per species.
+_BYTE_BITS = [tuple((value >> bit) & 1 for bit in range(8)) for value in range(256)]
 
 
 def decode_machine_learnset(data):
     """Decode the 100-bit machine learnset section into a list of 0/1 flags."""
-    bits = int.from_bytes(data, "little")
-    return [(bits >> i) & 1 for i in range(100)]
+    bits = []
+    for byte in data:
+        bits.extend(_BYTE_BITS[byte])
+    return bits[:100]
 
 
 # ======================================
 # Main Function
 # ======================================
 
-def main():
-    parser = argparse.ArgumentParser(description="Export personal and machine learnset data from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_1 = output_dir / OUTPUT_1_FILENAME
     output_2 = output_dir / OUTPUT_2_FILENAME
     log_file = output_dir / LOG_FILENAME
@@ -112,24 +130,13 @@ def main():
     with open(output_1, "w", newline="", encoding="utf-8") as csv1, \
          open(output_2, "w", newline="", encoding="utf-8") as csv2:
 
-        # Writer for personal data
-        personal_writer = csv.DictWriter(csv1, fieldnames=[
-            "species_id", "base_stat_hp", "base_stat_atk", "base_stat_def",
-            "base_stat_spd", "base_stat_spatk", "base_stat_spdef",
-            "type_1", "type_2", "catch_rate", "base_exp_yield",
-            "ev_yield_hp", "ev_yield_atk", "ev_yield_def", "ev_yield_spd",
-            "ev_yield_spatk", "ev_yield_spdef",
-            "held_item_1", "held_item_2",
-            "gender_ratio", "hatch_steps_rate", "base_friendship",
-            "growth_rate", "egg_group_1", "egg_group_2",
-            "ability_1", "ability_2", "flee_rate", "colour"
-        ])
-        personal_writer.writeheader()
+        # Writer for personal data (positional rows; see PERSONAL_FIELDNAMES)
+        personal_writer = csv.writer(csv1)
+        personal_writer.writerow(PERSONAL_FIELDNAMES)
 
         # Writer for machine learnsets (wide format: 0/1 flags per machine)
-        machine_fieldnames = ["species_id"] + [f"machine_{i:03d}" for i in range(1, 101)]
-        machine_writer = csv.DictWriter(csv2, fieldnames=machine_fieldnames)
-        machine_writer.writeheader()
+        machine_writer = csv.writer(csv2)
+        machine_writer.writerow(MACHINE_FIELDNAMES)
 
         for i in range(total_species):
             species_id = i
@@ -137,20 +144,15 @@ def main():
                 continue
 
             start = i * species_size
-            entry_data = data[start:start + species_size]
-            if len(entry_data) < species_size:
+            if start + species_size > len(data):
                 warnings.append(f"[WARN] Incomplete data for species_id {species_id}")
                 continue
 
-            # Write personal data
-            personal_writer.writerow(parse_personal_entry(entry_data, species_id))
+            # Write personal data (unpack_from reads in place, no 44-byte slice)
+            personal_writer.writerow(parse_personal_entry(data, start, species_id))
 
             # Write machine learnset data
-            learnset_bits = decode_machine_learnset(entry_data[28:44])
-            row = {"species_id": species_id}
-            for idx, bit in enumerate(learnset_bits, start=1):
-                row[f"machine_{idx:03d}"] = bit
-            machine_writer.writerow(row)
+            machine_writer.writerow([species_id] + decode_machine_learnset(data[start + 28:start + 44]))
 
     # Only create a log if there were issues
     if warnings:
@@ -163,5 +165,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export personal and machine learnset data from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()
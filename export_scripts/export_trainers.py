@@ -1,5 +1,9 @@
 import csv
 import argparse
+import mmap
+import struct
+from collections import namedtuple
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -123,20 +127,40 @@ class NarcError(Exception):
     pass
 
 
+# Precompiled scalar readers; unpack_from reads in place, no slice per field.
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_FATB_ENTRY = struct.Struct("<II")  # start, end offsets into FIMG
+
+
 def _u16le(b: bytes, off: int) -> int:
-    return int.from_bytes(b[off:off+2], "little")
+    return _U16.unpack_from(b, off)[0]
 
 
 def _u32le(b: bytes, off: int) -> int:
-    return int.from_bytes(b[off:off+4], "little")
+    return _U32.unpack_from(b, off)[0]
+
+
+# Uppercase hex of every byte value; joining LUT entries builds the preview
+# in one pass instead of hex() followed by a full upper() copy.
+_HEX_LUT = tuple(f"{i:02X}" for i in range(256))
+
 
+def _hex(b: bytes | memoryview) -> str:
+    return " ".join([_HEX_LUT[x] for x in b])
 
-def _hex(b: bytes) -> str:
-    return b.hex(" ").upper()
 
+def narc_open(data: bytes | mmap.mmap,
+              expected_size: int | None = None) -> tuple[int, Iterator[memoryview]]:
+    """Parse a DS NARC container (FATB/FIMG) and return its file count plus
+    a lazy iterator over the member files.
 
-def narc_extract_files(data: bytes) -> list[bytes]:
-    """Extract member files from a DS NARC archive using FATB/FIMG."""
+    Members are yielded as zero-copy memoryview slices of ``data``, so no
+    list of extracted files is materialized — consumers stream through the
+    archive one member at a time. Container-level errors raise here; a
+    malformed member range (or, when ``expected_size`` is given, a member
+    of any other size) raises NarcError during iteration.
+    """
     if len(data) < 16 or data[0:4] != b"NARC":
         raise NarcError("Missing NARC magic")
 
@@ -176,53 +200,60 @@ def narc_extract_files(data: bytes) -> list[bytes]:
     fimg_data_len = fimg_size - 8
     if fimg_data_off + fimg_data_len > len(data):
         raise NarcError("FIMG truncated")
-    fimg_data = data[fimg_data_off:fimg_data_off + fimg_data_len]
+    view = memoryview(data)
+    fimg_data = view[fimg_data_off:fimg_data_off + fimg_data_len]
 
-    files: list[bytes] = []
-    for idx in range(file_count):
-        eoff = entries_off + idx * 8
-        start = _u32le(data, eoff)
-        end = _u32le(data, eoff + 4)
-        if end < start or end > len(fimg_data):
-            raise NarcError(f"Invalid FATB range for file {idx}: {start}-{end} (fimg_len={len(fimg_data)})")
-        files.append(fimg_data[start:end])
+    # Decode the whole entry table in one C-level pass rather than one
+    # unpack call (plus offset arithmetic) per file.
+    entry_table = view[entries_off:entries_off + file_count * 8]
 
-    return files
+    def _members() -> Iterator[memoryview]:
+        for idx, (start, end) in enumerate(_FATB_ENTRY.iter_unpack(entry_table)):
+            if end < start or end > len(fimg_data):
+                raise NarcError(f"Invalid FATB range for file {idx}: {start}-{end} (fimg_len={len(fimg_data)})")
+            if expected_size is not None and end - start != expected_size:
+                raise NarcError(f"file {idx}: size {end - start} != expected {expected_size}")
+            yield fimg_data[start:end]
+
+    return file_count, _members()
 
 
 # ======================================
 # Trainer decoding (per agreed reference)
 # ======================================
 
-def _parse_properties(block20: bytes) -> dict[str, int]:
-    if len(block20) != 20:
-        raise ValueError("properties block not 20 bytes")
-
-    return {
-        "party_flags": block20[0],
-        "trainer_class": block20[1],
-        "unused": block20[2],
-        "party_size": block20[3],
-        "item1": int.from_bytes(block20[4:6], "little"),
-        "item2": int.from_bytes(block20[6:8], "little"),
-        "item3": int.from_bytes(block20[8:10], "little"),
-        "item4": int.from_bytes(block20[10:12], "little"),
-        "ai_flags": int.from_bytes(block20[12:16], "little"),
-        "battle_flags": int.from_bytes(block20[16:20], "little"),
-    }
+# 20-byte properties block: four u8 fields, four u16 item ids, then the
+# AI and battle flag words. Decoded in one C call per trainer; fields are
+# accessed as namedtuple attributes (no per-access string hashing).
+_PROP_STRUCT = struct.Struct("<4B4H2I")
+_PROPS = namedtuple("_PROPS", [
+    "party_flags", "trainer_class", "unused", "party_size",
+    "item1", "item2", "item3", "item4", "ai_flags", "battle_flags",
+])
 
 
-def _decode_party_flags(party_flags: int) -> tuple[int, int]:
-    return (1 if (party_flags & 0x01) else 0,
-            1 if (party_flags & 0x02) else 0)
-
+def _parse_properties(block20: bytes | memoryview) -> _PROPS:
+    if len(block20) != 20:
+        raise ValueError("properties block not 20 bytes")
 
-def _decode_ai_flag(ai_flags: int, bit: int) -> int:
-    return 1 if (ai_flags >> bit) & 1 else 0
+    return _PROPS._make(_PROP_STRUCT.unpack_from(block20))
 
 
-def _decode_double_battle(battle_flags: int) -> int:
-    return 1 if (battle_flags & 0x00000002) else 0
+# AI flag columns in bit order; the row build shifts ai_flags once per bit
+# instead of going through a helper call frame per flag.
+_AI_FIELDS = (
+    "ai_flag_00_basic",
+    "ai_flag_01_evaluate_attack",
+    "ai_flag_02_expert",
+    "ai_flag_03_setup",
+    "ai_flag_04_risky",
+    "ai_flag_05_damage_priority",
+    "ai_flag_06_baton_pass",
+    "ai_flag_07_tag_strategy",
+    "ai_flag_08_check_hp",
+    "ai_flag_09_weather",
+    "ai_flag_10_harassment",
+)
 
 
 def _attr_to_gender(attr: int) -> str:
@@ -247,49 +278,50 @@ def _align4(n: int) -> int:
     return (n + 3) & ~3
 
 
-def _parse_party_payload(payload: bytes, party_flags: int, party_size: int) -> list[dict]:
-    # dv(u8), attr(u8), level(u16le), species(u16le), [held_item(u16le)?], [moves(4*u16le)?], ball_seal(u16le)
-    moves_on = (party_flags & 0x01) != 0
-    items_on = (party_flags & 0x02) != 0
-    per_mon = 8 + (8 if moves_on else 0) + (2 if items_on else 0)
+# Party record: dv(u8), attr(u8), level(u16le), species(u16le),
+# [held_item(u16le)?], [moves(4*u16le)?], ball_seal(u16le). Only four flag
+# combinations exist, so each gets a precompiled Struct keyed by
+# (moves_on, items_on) and a whole payload decodes via one iter_unpack.
+_PARTY_STRUCTS = {
+    (False, False): struct.Struct("<BBHHH"),
+    (False, True): struct.Struct("<BBHHHH"),
+    (True, False): struct.Struct("<BBHH4HH"),
+    (True, True): struct.Struct("<BBHHH4HH"),
+}
 
-    expected_len = party_size * per_mon
+
+def _parse_party_payload(payload: bytes | memoryview, moves_on: int, items_on: int,
+                         party_size: int) -> list[tuple]:
+    """Decode a party payload into one tuple per mon:
+    (dv, attr, level, species, held_item, move_1..move_4, ball_seal),
+    with None for fields the flag variant does not carry.
+
+    ``moves_on``/``items_on`` are the flags the caller already decoded from
+    party_flags; they are threaded through rather than re-derived here.
+    """
+    record = _PARTY_STRUCTS[(bool(moves_on), bool(items_on))]
+
+    expected_len = party_size * record.size
     if len(payload) != expected_len:
         raise ValueError(f"payload size mismatch: expected {expected_len}, got {len(payload)}")
 
-    mons: list[dict] = []
-    off = 0
-    for _ in range(party_size):
-        dv = payload[off]
-        attr = payload[off + 1]
-        level = int.from_bytes(payload[off + 2:off + 4], "little")
-        species = int.from_bytes(payload[off + 4:off + 6], "little")
-        cursor = off + 6
+    mons: list[tuple] = []
+    for fields in record.iter_unpack(payload):
+        dv, attr, level, species = fields[:4]
+        cursor = 4
 
         held_item = None
         if items_on:
-            held_item = int.from_bytes(payload[cursor:cursor + 2], "little")
-            cursor += 2
+            held_item = fields[cursor]
+            cursor += 1
 
-        moves: list[int] = []
         if moves_on:
-            for __ in range(4):
-                moves.append(int.from_bytes(payload[cursor:cursor + 2], "little"))
-                cursor += 2
-
-        ball_seal = int.from_bytes(payload[cursor:cursor + 2], "little")
-
-        mons.append({
-            "dv": dv,
-            "attr": attr,
-            "level": level,
-            "species": species,
-            "held_item": held_item,
-            "moves": moves,
-            "ball_seal": ball_seal,
-        })
+            move_1, move_2, move_3, move_4 = fields[cursor:cursor + 4]
+        else:
+            move_1 = move_2 = move_3 = move_4 = None
 
-        off += per_mon
+        mons.append((dv, attr, level, species, held_item,
+                     move_1, move_2, move_3, move_4, fields[-1]))
 
     return mons
 
@@ -300,7 +332,7 @@ def _classify_and_log_trailing(
     expected_len: int,
     actual_len: int,
     aligned_len: int,
-    party_blob: bytes,
+    party_blob: bytes | memoryview,
     log_lines: list[str],
 ) -> None:
     extra_len = actual_len - expected_len
@@ -339,7 +371,7 @@ def _inspect_alignment_region(
     expected_len: int,
     actual_len: int,
     aligned_len: int,
-    party_blob: bytes,
+    party_blob: bytes | memoryview,
     log_lines: list[str],
 ) -> None:
     if actual_len <= expected_len:
@@ -348,14 +380,143 @@ def _inspect_alignment_region(
     pad = party_blob[expected_len:min(actual_len, aligned_len)]
     if not pad:
         return
-    if all(b == 0x00 for b in pad):
+    # memcmp against constant buffers instead of a Python loop per byte
+    if pad == bytes(len(pad)):
         return
-    if all(b == 0xFF for b in pad):
+    if pad == b"\xff" * len(pad):
         log_lines.append(f"[INFO] trainer_id {trainer_id}: alignment-region bytes use 0xFF ({_hex(pad)}).")
         return
     log_lines.append(f"[WARN] trainer_id {trainer_id}: unexpected bytes in alignment region after payload: {_hex(pad)}")
 
 
+class TrainerDataError(Exception):
+    """Raised by _decode_trainer when a trainer's data is invalid."""
+
+
+def _decode_trainer(trainer_id: int, prop: bytes | memoryview,
+                    party_blob: bytes | memoryview,
+                    log_lines: list[str]) -> list[object] | None:
+    """Decode one trainer's properties + party blob into a CSV row in
+    FIELDNAMES order, or None when the trainer is skipped.
+
+    Top-level on purpose: each trainer is independent, so this is the unit
+    a process pool would map over. Decoding stays sequential for now
+    because this worker already runs inside the orchestrator's pool, whose
+    daemonic processes cannot spawn their own.
+    """
+    props = _parse_properties(prop)
+
+    party_flags = props.party_flags
+    trainer_class = props.trainer_class
+    unused = props.unused
+    party_size = props.party_size
+
+    moves_on = 1 if (party_flags & 0x01) else 0
+    items_on = 1 if (party_flags & 0x02) else 0
+    per_mon = 8 + (8 if moves_on else 0) + (2 if items_on else 0)
+
+    expected_len = party_size * per_mon
+    aligned_len = _align4(expected_len)
+
+    # Trainer 0 special-case: sanity-check the placeholder and bail out
+    # before any of the decode/validation work below, so the common path
+    # carries no trainer-0 branches.
+    if trainer_id == 0:
+        if party_size != 0:
+            raise TrainerDataError(f"[ERROR] trainer_id 0: expected party_size=0 but found {party_size}")
+        if party_blob != b"\x00" * 8:
+            raise TrainerDataError(f"[ERROR] trainer_id 0: expected 8 bytes of zeros but found {_hex(party_blob)}")
+        if SKIP_FIRST:
+            return None
+        mons: list[tuple] = []
+    else:
+        if party_flags & ~0x03:
+            raise TrainerDataError(f"[ERROR] trainer_id {trainer_id}: unsupported party_flags 0x{party_flags:02X}")
+
+        if unused != 0:
+            log_lines.append(
+                f"[WARN] trainer_id {trainer_id}: expected unused byte 0x00 but found 0x{unused:02X}"
+            )
+
+        if party_size == 0:
+            raise TrainerDataError(f"[ERROR] trainer_id {trainer_id}: party_size=0 is invalid")
+        if not (1 <= party_size <= 6):
+            raise TrainerDataError(f"[ERROR] trainer_id {trainer_id}: party_size {party_size} outside expected range 1..6")
+
+        actual_len = len(party_blob)
+        if actual_len < expected_len:
+            raise TrainerDataError(
+                f"[ERROR] trainer_id {trainer_id}: party file too short.\n"
+                f"  party_flags=0x{party_flags:02X} moves={moves_on} items={items_on} party_size={party_size}\n"
+                f"  per_mon={per_mon} expected_len={expected_len} actual_len={actual_len}\n"
+                f"  properties_20_bytes={_hex(prop)}\n"
+                f"  party_bytes_preview={_hex(party_blob[:min(32, actual_len)])}"
+            )
+
+        # Log trailing behavior per agreed policy
+        _classify_and_log_trailing(
+            trainer_id=trainer_id,
+            per_mon=per_mon,
+            expected_len=expected_len,
+            actual_len=actual_len,
+            aligned_len=aligned_len,
+            party_blob=party_blob,
+            log_lines=log_lines,
+        )
+        _inspect_alignment_region(
+            trainer_id=trainer_id,
+            expected_len=expected_len,
+            actual_len=actual_len,
+            aligned_len=aligned_len,
+            party_blob=party_blob,
+            log_lines=log_lines,
+        )
+
+        payload = party_blob[:expected_len]
+
+        try:
+            mons = _parse_party_payload(payload, moves_on, items_on, party_size)
+        except Exception as e:
+            raise TrainerDataError(f"[ERROR] trainer_id {trainer_id}: failed to parse party payload: {e}")
+
+    ai_flags = props.ai_flags
+    battle_flags = props.battle_flags
+
+    row: list[object] = [
+        trainer_id,
+        moves_on,
+        items_on,
+        trainer_class,
+        party_size,
+        props.item1,
+        props.item2,
+        props.item3,
+        props.item4,
+    ]
+
+    row.extend((ai_flags >> bit) & 1 for bit in range(len(_AI_FIELDS)))
+    row.append(1 if (battle_flags & 0x00000002) else 0)
+
+    # Party members wide columns (1..6)
+    for idx in range(1, 7):
+        if idx <= len(mons):
+            (dv, attr, level, species, held_item,
+             move_1, move_2, move_3, move_4, ball_seal) = mons[idx - 1]
+            row.append(dv)
+            row.append(_attr_to_ability(attr))
+            row.append(_attr_to_gender(attr))
+            row.append(level)
+            row.append(species)
+            row.append(held_item if held_item is not None else "")
+            row.extend(m if m is not None else ""
+                       for m in (move_1, move_2, move_3, move_4))
+            row.append(ball_seal)
+        else:
+            row.extend([""] * 11)
+
+    return row
+
+
 # ======================================
 # Worker scaffolding (matches repo style)
 # ======================================
@@ -365,18 +526,13 @@ def _default_output_dir() -> Path:
     return Path("output") / ts
 
 
-def main() -> int:
-    ap = argparse.ArgumentParser(description="Export trainer data from ROM contents.")
-    ap.add_argument("--source", required=True, help="Path to ROM contents root folder.")
-    ap.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = ap.parse_args()
-
-    source_root = Path(args.source)
+def run_export(source: str, output: str | None = None) -> int:
+    source_root = Path(source)
     if not source_root.exists():
         print(f"[ERROR] Source folder not found: {source_root}")
         return 1
 
-    output_dir = Path(args.output) if args.output else _default_output_dir()
+    output_dir = Path(output) if output else _default_output_dir()
     output_dir.mkdir(parents=True, exist_ok=True)
 
     output_csv = output_dir / OUTPUT_FILENAME
@@ -403,177 +559,61 @@ def main() -> int:
     if not src2.exists():
         return _fail(f"[ERROR] Source file not found: {src2}")
 
-    data1 = src1.read_bytes()
-    data2 = src2.read_bytes()
+    # Map the NARCs instead of copying them into bytes objects; member files
+    # are zero-copy views into the mapping, which the OS pages in on demand.
+    # The maps are released when the last view is collected at worker exit.
+    try:
+        with src1.open("rb") as f1:
+            data1 = mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError as e:  # empty file cannot be mapped
+        return _fail(f"[ERROR] Failed to parse properties NARC: {e}")
+
+    try:
+        with src2.open("rb") as f2:
+            data2 = mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError as e:
+        return _fail(f"[ERROR] Failed to parse party NARC: {e}")
 
     try:
-        prop_files = narc_extract_files(data1)
+        prop_count, prop_iter = narc_open(data1, expected_size=SOURCE_1_BLOCK_SIZE)
     except Exception as e:
         return _fail(f"[ERROR] Failed to parse properties NARC: {e}")
 
     try:
-        party_files = narc_extract_files(data2)
+        party_count, party_iter = narc_open(data2)
     except Exception as e:
         return _fail(f"[ERROR] Failed to parse party NARC: {e}")
 
-    if len(prop_files) != len(party_files):
+    if prop_count != party_count:
         return _fail(
             "[ERROR] Properties/party file count mismatch.\n"
-            f"  properties_file_count={len(prop_files)}\n"
-            f"  party_file_count={len(party_files)}"
+            f"  properties_file_count={prop_count}\n"
+            f"  party_file_count={party_count}"
         )
 
-    total_trainers = len(prop_files)
-
-    for trainer_id, block in enumerate(prop_files):
-        if len(block) != SOURCE_1_BLOCK_SIZE:
-            return _fail(f"[ERROR] trainer_id {trainer_id}: properties file size {len(block)} != 20")
-
-    with output_csv.open("w", newline="", encoding="utf-8") as fcsv:
-        w = csv.DictWriter(fcsv, fieldnames=FIELDNAMES)
-        w.writeheader()
-
-        for trainer_id in range(total_trainers):
-            prop = prop_files[trainer_id]
-            props = _parse_properties(prop)
-
-            party_flags = int(props["party_flags"])
-            trainer_class = int(props["trainer_class"])
-            unused = int(props["unused"])
-            party_size = int(props["party_size"])
-
-            if party_flags & ~0x03:
-                return _fail(f"[ERROR] trainer_id {trainer_id}: unsupported party_flags 0x{party_flags:02X}")
-
-            if unused != 0:
-                log_lines.append(
-                    f"[WARN] trainer_id {trainer_id}: expected unused byte 0x00 but found 0x{unused:02X}"
-                )
-
-            moves_on, items_on = _decode_party_flags(party_flags)
-            per_mon = 8 + (8 if moves_on else 0) + (2 if items_on else 0)
-
-            party_blob = party_files[trainer_id]
-            expected_len = party_size * per_mon
-            aligned_len = _align4(expected_len)
-
-            # Trainer 0 special-case
-            if trainer_id == 0:
-                if party_size != 0:
-                    return _fail(f"[ERROR] trainer_id 0: expected party_size=0 but found {party_size}")
-                if party_blob != b"\x00" * 8:
-                    return _fail(f"[ERROR] trainer_id 0: expected 8 bytes of zeros but found {_hex(party_blob)}")
-                mons: list[dict] = []
-            else:
-                if party_size == 0:
-                    return _fail(f"[ERROR] trainer_id {trainer_id}: party_size=0 is invalid")
-                if not (1 <= party_size <= 6):
-                    return _fail(f"[ERROR] trainer_id {trainer_id}: party_size {party_size} outside expected range 1..6")
-
-                actual_len = len(party_blob)
-                if actual_len < expected_len:
-                    return _fail(
-                        f"[ERROR] trainer_id {trainer_id}: party file too short.\n"
-                        f"  party_flags=0x{party_flags:02X} moves={moves_on} items={items_on} party_size={party_size}\n"
-                        f"  per_mon={per_mon} expected_len={expected_len} actual_len={actual_len}\n"
-                        f"  properties_20_bytes={_hex(prop)}\n"
-                        f"  party_bytes_preview={_hex(party_blob[:min(32, actual_len)])}"
-                    )
-
-                # Log trailing behavior per agreed policy
-                _classify_and_log_trailing(
-                    trainer_id=trainer_id,
-                    per_mon=per_mon,
-                    expected_len=expected_len,
-                    actual_len=actual_len,
-                    aligned_len=aligned_len,
-                    party_blob=party_blob,
-                    log_lines=log_lines,
-                )
-                _inspect_alignment_region(
-                    trainer_id=trainer_id,
-                    expected_len=expected_len,
-                    actual_len=actual_len,
-                    aligned_len=aligned_len,
-                    party_blob=party_blob,
-                    log_lines=log_lines,
-                )
-
-                payload = party_blob[:expected_len]
+    with output_csv.open("w", newline="", encoding="utf-8",
+                         buffering=1024 * 1024) as fcsv:
+        w = csv.writer(fcsv)
+        w.writerow(FIELDNAMES)
 
+        # Rows are built positionally in FIELDNAMES order and flushed with a
+        # single writerows call after the loop. Trainer blobs stream straight
+        # out of both NARC iterators — no per-archive member lists.
+        all_rows: list[list[object]] = []
+
+        try:
+            for trainer_id, (prop, party_blob) in enumerate(zip(prop_iter, party_iter)):
                 try:
-                    mons = _parse_party_payload(payload, party_flags, party_size)
-                except Exception as e:
-                    return _fail(f"[ERROR] trainer_id {trainer_id}: failed to parse party payload: {e}")
-
-            if SKIP_FIRST and trainer_id == 0:
-                continue
-
-            ai_flags = int(props["ai_flags"])
-            battle_flags = int(props["battle_flags"])
-
-            row: dict[str, object] = {}
-            row["trainer_id"] = trainer_id
-            row["party_flag_explicit_moves"] = moves_on
-            row["party_flag_enable_held_items"] = items_on
-            row["trainer_class_id"] = trainer_class
-            row["party_size"] = party_size
-            row["trainer_item_id_1"] = props["item1"]
-            row["trainer_item_id_2"] = props["item2"]
-            row["trainer_item_id_3"] = props["item3"]
-            row["trainer_item_id_4"] = props["item4"]
-
-            row["ai_flag_00_basic"] = _decode_ai_flag(ai_flags, 0)
-            row["ai_flag_01_evaluate_attack"] = _decode_ai_flag(ai_flags, 1)
-            row["ai_flag_02_expert"] = _decode_ai_flag(ai_flags, 2)
-            row["ai_flag_03_setup"] = _decode_ai_flag(ai_flags, 3)
-            row["ai_flag_04_risky"] = _decode_ai_flag(ai_flags, 4)
-            row["ai_flag_05_damage_priority"] = _decode_ai_flag(ai_flags, 5)
-            row["ai_flag_06_baton_pass"] = _decode_ai_flag(ai_flags, 6)
-            row["ai_flag_07_tag_strategy"] = _decode_ai_flag(ai_flags, 7)
-            row["ai_flag_08_check_hp"] = _decode_ai_flag(ai_flags, 8)
-            row["ai_flag_09_weather"] = _decode_ai_flag(ai_flags, 9)
-            row["ai_flag_10_harassment"] = _decode_ai_flag(ai_flags, 10)
-
-            row["battle_flag_doubles"] = _decode_double_battle(battle_flags)
-
-            # Party members wide columns (1..6)
-            for idx in range(1, 7):
-                prefix = f"party_member_{idx}_"
-                if idx <= len(mons):
-                    m = mons[idx - 1]
-                    row[prefix + "dv"] = m["dv"]
-                    row[prefix + "ability_slot"] = _attr_to_ability(int(m["attr"]))
-                    row[prefix + "gender"] = _attr_to_gender(int(m["attr"]))
-                    row[prefix + "level"] = m["level"]
-                    row[prefix + "species_id"] = m["species"]
-
-                    if items_on:
-                        row[prefix + "held_item"] = m["held_item"] if m["held_item"] is not None else ""
-                    else:
-                        row[prefix + "held_item"] = ""
-
-                    if moves_on:
-                        moves = list(m["moves"])
-                        for mi in range(4):
-                            row[prefix + f"explicit_move_id_{mi+1}"] = moves[mi] if mi < len(moves) else ""
-                    else:
-                        for mi in range(4):
-                            row[prefix + f"explicit_move_id_{mi+1}"] = ""
-
-                    row[prefix + "ball_seal"] = m["ball_seal"]
-                else:
-                    row[prefix + "dv"] = ""
-                    row[prefix + "ability_slot"] = ""
-                    row[prefix + "gender"] = ""
-                    row[prefix + "level"] = ""
-                    row[prefix + "species_id"] = ""
-                    row[prefix + "held_item"] = ""
-                    for mi in range(4):
-                        row[prefix + f"explicit_move_id_{mi+1}"] = ""
-                    row[prefix + "ball_seal"] = ""
-
-            w.writerow(row)
+                    row = _decode_trainer(trainer_id, prop, party_blob, log_lines)
+                except TrainerDataError as e:
+                    return _fail(str(e))
+
+                if row is not None:
+                    all_rows.append(row)
+        except NarcError as e:
+            return _fail(f"[ERROR] Invalid NARC member table: {e}")
+
+        w.writerows(all_rows)
 
     _write_log()
     if log_lines:
@@ -587,5 +627,13 @@ def main() -> int:
     return 0
 
 
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Export trainer data from ROM contents.")
+    ap.add_argument("--source", required=True, help="Path to ROM contents root folder.")
+    ap.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = ap.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -19,6 +19,12 @@ MISSING_SPECIES = [494, 495]  # Egg and Bad Egg
 # ======================================
 # Main Function
 # ======================================
+
+# LSB-first bits of every byte value, so expanding a byte is one table
+# lookup instead of eight shift/mask operations.
+_BIT_LUT_LE = [tuple((value >> bit) & 1 for bit in range(8)) for value in range(256)]
+
+
 def parse_tutor_learnsets(data: bytes):
     total_entries = len(data) // BYTES_PER_SPECIES
     results = []
@@ -37,15 +43,13 @@ def parse_tutor_learnsets(data: bytes):
             species_id += 1
 
         start = i * BYTES_PER_SPECIES
-        entry = data[start:start + BYTES_PER_SPECIES]
 
-        # Convert each byte into 8 bits (LSB-first)
+        # Convert each byte into 8 bits (LSB-first) via the lookup table
         bits = []
-        for byte in entry:
-            bits.extend([(byte >> b) & 1 for b in range(8)])
+        for byte in data[start:start + BYTES_PER_SPECIES]:
+            bits.extend(_BIT_LUT_LE[byte])
 
-        bits = bits[:TUTORABLE_MOVE_COUNT]
-        results.append([species_id] + bits)
+        results.append([species_id] + bits[:TUTORABLE_MOVE_COUNT])
         species_id += 1
 
     log_lines.append(
@@ -59,21 +63,16 @@ def parse_tutor_learnsets(data: bytes):
 # ======================================
 # Entry Point
 # ======================================
-def main():
-    parser = argparse.ArgumentParser(description="Export tutor learnsets from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents root (folder containing 'data').")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>).")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Timestamped output folder
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -103,5 +102,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export tutor learnsets from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents root (folder containing 'data').")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>).")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()
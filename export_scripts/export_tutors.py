@@ -19,12 +19,24 @@ BYTES_PER_ENTRY = 4     # 4 bytes per entry (2 for move_id, 1 for cost, 1 for tu
 # Main Function
 # ======================================
 def read_tutors(file_path):
-    with open(file_path, "rb") as f:
-        f.seek(START_OFFSET)
-        data = f.read(ENTRY_COUNT * BYTES_PER_ENTRY)
-
-        if len(data) < ENTRY_COUNT * BYTES_PER_ENTRY:
-            raise ValueError(f"File too short: expected {(ENTRY_COUNT * BYTES_PER_ENTRY)} bytes from offset {START_OFFSET}, got {len(data)}.")
+    need = ENTRY_COUNT * BYTES_PER_ENTRY
+
+    # The tutor block has a known size at a known offset, so issue one
+    # positioned read instead of open + seek + buffered read. pread is not
+    # available on Windows; fall back to an unbuffered seek/read there.
+    if hasattr(os, "pread"):
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            data = os.pread(fd, need, START_OFFSET)
+        finally:
+            os.close(fd)
+    else:
+        with open(file_path, "rb", buffering=0) as f:
+            f.seek(START_OFFSET)
+            data = f.read(need)
+
+    if len(data) < need:
+        raise ValueError(f"File too short: expected {need} bytes from offset {START_OFFSET}, got {len(data)}.")
 
     tutors = []
     for i in range(ENTRY_COUNT):
@@ -39,20 +51,15 @@ def read_tutors(file_path):
 # ======================================
 # Entry Point
 # ======================================
-def main():
-    parser = argparse.ArgumentParser(description="Export tutor move data from overlay_0001.bin")
-    parser.add_argument("--source", required=True, help="Path to the root game data folder")
-    parser.add_argument("--output", required=False, help="Output directory path")
-    args = parser.parse_args()
-
-    base_path = Path(args.source)
+def run_export(source, output=None):
+    base_path = Path(source)
     source_path = base_path / SOURCE_FILENAME
 
     if not source_path.exists():
         print(f"[ERROR] Source file not found: {source_path}")
         return 1
 
-    output_dir = Path(args.output or "output")
+    output_dir = Path(output or "output")
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
@@ -78,5 +85,13 @@ def main():
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export tutor move data from overlay_0001.bin")
+    parser.add_argument("--source", required=True, help="Path to the root game data folder")
+    parser.add_argument("--output", required=False, help="Output directory path")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()
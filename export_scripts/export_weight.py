@@ -1,6 +1,8 @@
 import os
-import csv
 import argparse
+import mmap
+import sys
+from array import array
 from datetime import datetime
 from pathlib import Path
 
@@ -21,21 +23,16 @@ SKIP_FIRST = True  # skip species_id 0
 # Main Function
 # ======================================
 
-def main():
-    parser = argparse.ArgumentParser(description="Export species weight data from ROM contents.")
-    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
-    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
-    args = parser.parse_args()
-
+def run_export(source, output=None):
     # Determine output folder (timestamped if not provided)
-    if args.output:
-        output_dir = Path(args.output)
+    if output:
+        output_dir = Path(output)
     else:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
         output_dir = Path("output") / timestamp
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    source_path = Path(args.source) / SOURCE_FILENAME
+    source_path = Path(source) / SOURCE_FILENAME
     output_file = output_dir / OUTPUT_FILENAME
     log_file = output_dir / LOG_FILENAME
 
@@ -45,47 +42,78 @@ def main():
 
     warnings = []
 
-    # Read relevant bytes
+    # Map the source and take the fixed window as a zero-copy view; the OS
+    # pages bytes in as the array decode walks them.
     with open(source_path, "rb") as f:
-        f.seek(START_OFFSET)
-        data = f.read(TOTAL_EXPECTED_SPECIES * 4)
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            mm = None
+
+    window = memoryview(mm)[START_OFFSET:START_OFFSET + TOTAL_EXPECTED_SPECIES * 4] \
+        if mm is not None else memoryview(b"")
 
-    if len(data) < TOTAL_EXPECTED_SPECIES * 4:
+    if len(window) < TOTAL_EXPECTED_SPECIES * 4:
         warnings.append(
-            f"[WARN] Expected {TOTAL_EXPECTED_SPECIES * 4} bytes but found only {len(data)} from offset 0x{START_OFFSET:X}."
+            f"[WARN] Expected {TOTAL_EXPECTED_SPECIES * 4} bytes but found only {len(window)} from offset 0x{START_OFFSET:X}."
         )
 
-    with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(["species_id", "weight"])
-
-        species_count = min(TOTAL_EXPECTED_SPECIES, len(data) // 4)
-
-        for i in range(species_count):
-            start = i * 4
-            weight_bytes = data[start:start + 2]
-            padding_bytes = data[start + 2:start + 4]
-
-            weight = int.from_bytes(weight_bytes, "little")
-
-            # Validate padding (should be 00 00)
-            if padding_bytes != b"\x00\x00":
+    species_count = min(TOTAL_EXPECTED_SPECIES, len(window) // 4)
+
+    # Decode all records as little-endian u16 values in one pass, then split
+    # into the weight and padding columns instead of slicing per species.
+    values = array("H")
+    values.frombytes(window[:species_count * 4])
+    if sys.byteorder == "big":
+        values.byteswap()
+    window.release()
+    if mm is not None:
+        mm.close()
+    weights = values[0::2]
+    padding = values[1::2]
+
+    # Validate padding (should be 00 00). One bulk zero-count covers the
+    # common all-clean case; only walk per species when something is set.
+    if padding.count(0) != len(padding):
+        for i, pad in enumerate(padding):
+            if pad:
                 warnings.append(
-                    f"[WARN] Non-zero padding ({padding_bytes.hex(' ').upper()}) at species_id {i}."
+                    f"[WARN] Non-zero padding ({pad.to_bytes(2, 'little').hex(' ').upper()}) at species_id {i}."
                 )
 
-            if not (SKIP_FIRST and i == 0):
-                writer.writerow([i, weight])
+    start_id = 1 if SKIP_FIRST else 0
+
+    # Two plain integer columns never need quoting, so format the rows into
+    # one reusable bytearray with C-level bytes %-formatting and write the
+    # file in a single binary call, skipping csv.writer and the text layer.
+    # Line endings stay \r\n to match what csv.writer emitted.
+    buf = bytearray(b"species_id,weight\r\n")
+    for i in range(start_id, species_count):
+        buf += b"%d,%d\r\n" % (i, weights[i])
+    with open(output_file, "wb") as csvfile:
+        csvfile.write(buf)
 
-    # Write log file only if warnings exist
+    # Write log file only if warnings exist (pre-encoded, one write syscall)
     if warnings:
-        with open(log_file, "w", encoding="utf-8") as log:
-            log.write("\n".join(warnings))
+        payload = "\n".join(warnings).encode("utf-8")
+        fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
         print(f"[WARN] {len(warnings)} issue(s) written to {log_file}")
 
     print(f"[OK] Export complete: {output_file}")
     return 0
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Export species weight data from ROM contents.")
+    parser.add_argument("--source", required=True, help="Path to ROM contents directory")
+    parser.add_argument("--output", default=None, help="Output directory (default: ./output/<timestamp>)")
+    args = parser.parse_args()
+    return run_export(args.source, args.output)
+
+
 if __name__ == "__main__":
     main()